@@ -4,13 +4,20 @@ import logging
 from pydoc import locate
 from importlib import import_module
 import commentjson
-import yaml
 from typing import NamedTuple
 from urllib.parse import urlparse
 from urllib.request import urlopen, Request
 import os
+import json
 from python_log_indenter import IndentedLoggerAdapter
 
+# orjson is optional; it serializes several times faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class ColorFormatter(logging.Formatter):
     """Colored console formatter with customizable format string"""
     
@@ -239,31 +246,33 @@ def instantiate(class_str: str, **kwargs):
         module_path, class_name = class_str.rsplit('.', 1)
         module = import_module(module_path)
         klass = getattr(module, class_name)
+        return instantiate_class(klass, **kwargs)
+    except (ImportError, AttributeError) as ex:
+        raise ex
 
-        if klass == type(()):
-            signature = inspect.signature(klass.__init__)
-            instance = klass(kwargs.values())
-        else:
-            signature = inspect.signature(klass.__init__)
-            constructor_args = {}
+def instantiate_class(klass, **kwargs):
+    """Like instantiate, for a class that is already in hand (no import by name)"""
+    if klass == type(()):
+        instance = klass(kwargs.values())
+    else:
+        signature = inspect.signature(klass.__init__)
+        constructor_args = {}
 
-            for name, param in signature.parameters.items():
-                if name == "self" or name == "args" or name == "kwargs":
-                    continue
-                if name in kwargs:
-                    constructor_args[name] = kwargs[name]
-                    kwargs.pop(name)
-                else:
-                    if param.default == param.empty:
-                        raise ValueError(f"Missing required argument: {name}")
-            
-            instance = klass(**constructor_args)        
-            for k, v in kwargs.items():
-                setattr(instance, k, v)
+        for name, param in signature.parameters.items():
+            if name == "self" or name == "args" or name == "kwargs":
+                continue
+            if name in kwargs:
+                constructor_args[name] = kwargs[name]
+                kwargs.pop(name)
+            else:
+                if param.default == param.empty:
+                    raise ValueError(f"Missing required argument: {name}")
         
-        return instance
-    except (ImportError, AttributeError) as ex:
-        raise ex
+        instance = klass(**constructor_args)        
+        for k, v in kwargs.items():
+            setattr(instance, k, v)
+    
+    return instance
 
 def json2obj(filename): 
     f = None
@@ -293,6 +302,18 @@ def loadjson(filename, expand_env: bool = False):
         if f is not None:
             f.close()
 
+def dumpjson(obj, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        option |= (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the json module handles
+            pass
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys).encode('utf-8')
+
 def loads(data, expand_env: bool = False):
     try:
         if expand_env:
@@ -322,14 +343,20 @@ def expand_env_vars(text: str) -> str:
     text = os.path.expandvars(text)
     return text
 
+def parseyaml(data: str, expand_env: bool = False):
+    """Parse YAML text, optionally expanding environment variables first"""
+    # Imported here so that importing conduit doesn't load yaml until a config needs it
+    import yaml
+    
+    if expand_env:
+        data = expand_env_vars(data)
+    return yaml.load(data, Loader = yaml.FullLoader)
+
 def loadyaml(filename, expand_env: bool = False):
     f = None
     try:
         f = open(filename)
-        data = f.read()
-        if expand_env:
-            data = expand_env_vars(data)
-        return yaml.load(data, Loader = yaml.FullLoader)
+        return parseyaml(f.read(), expand_env)
     except Exception as e:
         print(e)
         return None
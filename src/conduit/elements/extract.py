@@ -2,6 +2,8 @@ from typing import Generator, Iterator, Any, Union, Optional
 from dataclasses import dataclass
 from ..pipelineElement import PipelineElement
 
+_MISSING = object()
+
 @dataclass
 class ExtractInput:
     """Input specification for Extract element
@@ -42,13 +44,13 @@ class Extract(PipelineElement):
                 else:
                     raise ValueError(f"Cannot index non-sequence type {type(current)} with {part}")
             else:
-                # Attribute access for objects/dicts
-                if hasattr(current, part):
-                    current = getattr(current, part)
-                elif isinstance(current, dict) and part in current:
-                    current = current[part]
-                else:
+                # Attribute access for objects/dicts (single lookup each)
+                value = getattr(current, part, _MISSING)
+                if value is _MISSING and isinstance(current, dict):
+                    value = current.get(part, _MISSING)
+                if value is _MISSING:
                     raise ValueError(f"Cannot access '{part}' on {type(current)}")
+                current = value
         
         return current
     
@@ -1,7 +1,7 @@
 from typing import Generator, Iterator, Any, Optional
 from dataclasses import dataclass
 from ..pipelineElement import PipelineElement
-from ..template_renderer import SafeTemplateRenderer
+from ..template_renderer import get_template_renderer
 
 @dataclass
 class FormatInput:
@@ -34,7 +34,7 @@ class Format(PipelineElement):
         super().__init__()  # Automatically captures all constructor parameters
     
     def process(self, input: Iterator[FormatInput]) -> Generator[str, None, None]:
-        renderer = SafeTemplateRenderer()
+        renderer = get_template_renderer()
         
         for format_input in input:
             # Apply constructor defaults to None fields
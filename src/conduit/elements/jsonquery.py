@@ -1,9 +1,15 @@
 from typing import Generator, Iterator, Any, Optional
 from dataclasses import dataclass
 from ..pipelineElement import PipelineElement
+import functools
 import json
 import jq
 
+@functools.lru_cache(maxsize=256)
+def _compile_query(query: str):
+    """Compile a jq query once and share the program across JsonQuery instances."""
+    return jq.compile(query)
+
 @dataclass
 class JsonQueryInput:
     """Input specification for JsonQuery element
@@ -29,9 +35,8 @@ class JsonQuery(PipelineElement):
             query: Default jq query string (e.g., ".results", ".data[0].name", ".users[]")
         """
         super().__init__()  # Automatically captures all constructor parameters
-        # Pre-compile the default query for efficiency
-        self._compiled_query = jq.compile(query)
-        self._default_query = query
+        # Pre-compile the default query so invalid queries fail at construction
+        _compile_query(query)
     
     def process(self, input: Iterator[JsonQueryInput]) -> Generator[Any, None, None]:
         """Process each input item by applying the jq query."""
@@ -45,29 +50,22 @@ class JsonQuery(PipelineElement):
                 query = "."
             
             try:
-                # Convert input to JSON-like structure if it's a string
+                # Reuse the compiled program for this query
+                compiled_query = _compile_query(query)
+                
                 item = json_input.input
                 if isinstance(item, str):
+                    # Parse separately from running the query, so that jq
+                    # errors on valid JSON reach the error dict below
                     try:
-                        data = json.loads(item)
-                    except json.JSONDecodeError:
+                        item = json.loads(item)
+                    except ValueError:
                         # If it's not valid JSON, treat as string literal
-                        data = item
-                else:
-                    data = item
-                
-                # Use compiled query if it matches, otherwise compile new one
-                if query == self._default_query:
-                    compiled_query = self._compiled_query
+                        pass
+                    yield from compiled_query.input_value(item).all()
                 else:
-                    compiled_query = jq.compile(query)
-                
-                # Execute the query using the correct jq API
-                program_with_input = compiled_query.input_value(data)
-                
-                # Use the built-in iter() function to iterate over results
-                for result in iter(program_with_input):
-                    yield result
+                    # Execute the query; jq already yields each result of an iterating query
+                    yield from compiled_query.input_value(item)
             
             except Exception as e:
                 # Yield error information for debugging
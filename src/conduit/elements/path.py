@@ -30,6 +30,12 @@ class PathTransform(PipelineElement):
             # Apply constructor defaults to None fields
             path_input = self.apply_defaults(path_input)
             
+            # Plain {{ path }} templates skip Jinja2 and the context entirely
+            render = renderer.compile_path_template(path_input.format)
+            if render is not None:
+                yield render(path_input.input)
+                continue
+            
             context = get_functions()
             context["path"] = path_input.input
             context["input"] = path_input.input
@@ -4,6 +4,9 @@ from ..pipelineElement import PipelineElement
 from ..template_renderer import get_template_renderer
 import re
 
+# Characters that make a pattern more than a literal substring
+_REGEX_METACHARS = re.compile(r"[.^$*+?()\[\]{}|\\]")
+
 @dataclass
 class ReplaceInput:
     """Input specification for Replace element
@@ -62,11 +65,23 @@ class Replace(PipelineElement):
                 # Render replacement template
                 rendered_replacement = renderer.render_template(replacement, context)
                 
-                # Compile regex pattern
-                regex = re.compile(rendered_pattern, replace_input.flags)
+                # Without a backslash there are no group references or escapes to expand
+                literal_replacement = "\\" not in rendered_replacement
+                
+                if (literal_replacement and not replace_input.flags and isinstance(text, str)
+                        and not _REGEX_METACHARS.search(rendered_pattern)):
+                    # Plain substring substitution needs no regex engine at all
+                    result = text.replace(rendered_pattern, rendered_replacement)
+                else:
+                    # Compile regex pattern
+                    regex = re.compile(rendered_pattern, replace_input.flags)
+                    
+                    # Perform substitution; a literal replacement skips re's template parsing
+                    if literal_replacement:
+                        result = regex.sub(lambda _match: rendered_replacement, text)
+                    else:
+                        result = regex.sub(rendered_replacement, text)
                 
-                # Perform substitution
-                result = regex.sub(rendered_replacement, text)
                 yield result
             
             except re.error as e:
@@ -7,6 +7,23 @@ import urllib.parse
 import json
 import ssl
 
+_RESPONSE_FORMATS = frozenset(('json', 'text', 'binary'))
+_HTTP_METHODS = frozenset(('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'))
+_BODY_METHODS = frozenset(('POST', 'PUT', 'PATCH'))
+
+# Shared SSL context for requests with verification disabled
+_unverified_ssl_context = None
+
+def _get_unverified_ssl_context() -> ssl.SSLContext:
+    """Get the shared SSL context that skips certificate verification"""
+    global _unverified_ssl_context
+    if _unverified_ssl_context is None:
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        _unverified_ssl_context = ssl_context
+    return _unverified_ssl_context
+
 @dataclass
 class RestApiInput:
     """Input specification for RestApi element
@@ -23,6 +40,7 @@ class RestApiInput:
     verify_ssl: Optional[bool] = None
     response_format: Optional[str] = None
     output_template: Optional[str] = None
+    include_metadata: Optional[bool] = None
 
 class RestApi(PipelineElement):
     """
@@ -42,7 +60,8 @@ class RestApi(PipelineElement):
         timeout: int = 30,
         verify_ssl: bool = True,
         response_format: str = "json",  # json, text, binary
-        output_template: Optional[str] = None
+        output_template: Optional[str] = None,
+        include_metadata: bool = False
     ):
         """
         Initialize REST API element.
@@ -57,6 +76,8 @@ class RestApi(PipelineElement):
             verify_ssl: Default SSL verification setting
             response_format: Default response parsing format (json, text, binary)
             output_template: Default Jinja2 template for formatting output
+            include_metadata: Attach response metadata (status code, headers, url) to
+                each result. Always enabled when output_template is set.
         """
         super().__init__()  # Automatically captures all constructor parameters
     
@@ -68,8 +89,11 @@ class RestApi(PipelineElement):
             # Apply constructor defaults to None fields
             request = self.apply_defaults(request)
             
+            # Normalize once per request
+            response_format = request.response_format.lower()
+            
             # Validate response format
-            if request.response_format.lower() not in ['json', 'text', 'binary']:
+            if response_format not in _RESPONSE_FORMATS:
                 raise ValueError(f"Unsupported response format: {request.response_format}")
             
             try:
@@ -90,7 +114,10 @@ class RestApi(PipelineElement):
                         rendered_query_params[key] = renderer.render_template(str(value), context)
                 
                 # Add query parameters to URL
-                if rendered_query_params:
+                if rendered_query_params and '?' not in rendered_url and '#' not in rendered_url:
+                    # No existing query or fragment to merge with, so just append
+                    rendered_url += '?' + urllib.parse.urlencode(rendered_query_params, doseq=True)
+                elif rendered_query_params:
                     url_parts = urllib.parse.urlparse(rendered_url)
                     query = urllib.parse.parse_qs(url_parts.query)
                     query.update(rendered_query_params)
@@ -110,11 +137,11 @@ class RestApi(PipelineElement):
                 method = request.method.upper()
                 
                 # Validate method
-                if method not in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
+                if method not in _HTTP_METHODS:
                     raise ValueError(f"Unsupported HTTP method: {method}")
                 
                 # Handle request body if provided
-                if request.body and method in ['POST', 'PUT', 'PATCH']:
+                if request.body and method in _BODY_METHODS:
                     # Render body template
                     rendered_body = renderer.render_template(request.body, context)
                     request_data = rendered_body.encode('utf-8')
@@ -140,9 +167,7 @@ class RestApi(PipelineElement):
                 # Configure SSL context
                 ssl_context = None
                 if not request.verify_ssl:
-                    ssl_context = ssl.create_default_context()
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
+                    ssl_context = _get_unverified_ssl_context()
                 
                 # Make the request
                 try:
@@ -151,7 +176,7 @@ class RestApi(PipelineElement):
                         response_data = response.read()
                         
                         # Parse response based on format
-                        if request.response_format.lower() == 'json':
+                        if response_format == 'json':
                             try:
                                 parsed_response = json.loads(response_data.decode('utf-8'))
                             except json.JSONDecodeError:
@@ -159,29 +184,30 @@ class RestApi(PipelineElement):
                                     'error': 'Invalid JSON response',
                                     'raw_response': response_data.decode('utf-8', errors='replace')
                                 }
-                        elif request.response_format.lower() == 'text':
+                        elif response_format == 'text':
                             parsed_response = response_data.decode('utf-8')
                         else:  # binary
                             parsed_response = response_data
                         
+                        # Skip building metadata (and copying every header) unless it is used
+                        if not (request.include_metadata or request.output_template):
+                            yield parsed_response
+                            continue
+                        
                         # Add response metadata
+                        metadata = {
+                            'status_code': response.status,
+                            'headers': dict(response.headers),
+                            'url': response.url
+                        }
                         if isinstance(parsed_response, dict):
-                            parsed_response['_metadata'] = {
-                                'status_code': response.status,
-                                'headers': dict(response.headers),
-                                'url': response.url
-                            }
+                            parsed_response['_metadata'] = metadata
                         else:
                             # For non-dict responses, wrap in a dict with metadata
-                            result_dict = {
+                            parsed_response = {
                                 'data': parsed_response,
-                                '_metadata': {
-                                    'status_code': response.status,
-                                    'headers': dict(response.headers),
-                                    'url': response.url
-                                }
+                                '_metadata': metadata
                             }
-                            parsed_response = result_dict
                         
                         # Apply output template if provided
                         if request.output_template:
@@ -209,7 +235,7 @@ class RestApi(PipelineElement):
                     # Try to read error response body
                     try:
                         error_body = e.read().decode('utf-8')
-                        if request.response_format.lower() == 'json':
+                        if response_format == 'json':
                             try:
                                 error_response['error_details'] = json.loads(error_body)
                             except json.JSONDecodeError:
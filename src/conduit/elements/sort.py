@@ -1,7 +1,34 @@
 from dataclasses import dataclass
-from typing import Iterator, List, Any, Optional, Generator
+from typing import Callable, Iterator, List, Any, Optional, Generator
 from ..pipelineElement import PipelineElement
 from ..common import logger
+import functools
+import heapq
+import itertools
+import logging
+import operator
+import re
+
+# Matches plain attribute chains such as "input.size" or "input.stats.level"
+_ATTRIBUTE_PATH = re.compile(r"input((?:\.[A-Za-z_]\w*)+)")
+
+@functools.lru_cache(maxsize=None)
+def _compile_key(expression: str) -> Callable[[Any], Any]:
+    """Turn a key expression into a callable, parsing it only once.
+    
+    The default "str(input)" and plain attribute chains skip eval entirely;
+    anything else is compiled once and evaluated with builtins disabled.
+    """
+    expression = expression.strip()
+    if expression == "str(input)":
+        return str
+    
+    match = _ATTRIBUTE_PATH.fullmatch(expression)
+    if match:
+        return operator.attrgetter(match.group(1)[1:])
+    
+    code = compile(expression, "<sort-key>", "eval")
+    return lambda value: eval(code, {"__builtins__": {}}, {"input": value})
 
 @dataclass
 class SortInput:
@@ -9,6 +36,9 @@ class SortInput:
     input: Any
     key: Optional[str] = None
     reverse: Optional[bool] = None
+    limit: Optional[int] = None
+    sorted_runs: Optional[bool] = None
+    run_boundary_key: Optional[str] = None
 
 class Sort(PipelineElement):
     """
@@ -23,15 +53,26 @@ class Sort(PipelineElement):
     - Sort by nested field: key: "input.stats.level"
     - Sort by expression: key: "len(input.name)"
     - Reverse sort: reverse: true
+    - Top 10 only: limit: 10
+    - Merge pre-sorted runs: sorted_runs: true, run_boundary_key: "input.directory"
     """
     
-    def __init__(self, key: str = "str(input)", reverse: bool = False):
+    def __init__(self, key: str = "str(input)", reverse: bool = False, limit: Optional[int] = None,
+                 sorted_runs: bool = False, run_boundary_key: Optional[str] = None):
         """
         Initialize Sort element with configuration.
         
         Args:
             key: Expression to evaluate for sort key (default: "str(input)")
             reverse: Sort in descending order if True (default: False)
+            limit: Only output the first N sorted items (default: None, output all).
+                Uses a heap, so only N items are held in memory.
+            sorted_runs: Input arrives as consecutive runs that are each already
+                sorted by `key`; the runs are k-way merged instead of re-sorted
+                (default: False).
+            run_boundary_key: Expression whose value changes at each run
+                boundary (default: None, a new run starts whenever the sort
+                key goes out of order). Only used with sorted_runs.
         """
         super().__init__()  # Automatically captures all constructor parameters
     
@@ -41,45 +82,56 @@ class Sort(PipelineElement):
             logger().push()
             logger().debug("Sort: Starting processing")
             
-            # Collect all items first (Sort requires materializing the iterator)
-            items = list(input)
-            logger().debug(f"Sort: Collected {len(items)} items to sort")
-            
-            if not items:
-                logger().debug("Sort: No items to sort")
-                return
-            
             # Create a dummy SortInput to get defaults, then apply them
             dummy_input = SortInput(input=None)
             defaults = self.apply_defaults(dummy_input)
             
-            # Apply defaults to all items and collect actual data to sort
-            sort_data = []
-            for sort_input in items:
-                # Apply constructor defaults to None fields
-                sort_input = self.apply_defaults(sort_input)
-                sort_data.append(sort_input)
+            logger().debug(f"Sort: Using key expression '{defaults.key}', reverse={defaults.reverse}, limit={defaults.limit}")
             
-            logger().debug(f"Sort: Using key expression '{defaults.key}', reverse={defaults.reverse}")
+            # Per-item debug messages are only formatted when they will be emitted
+            log = logger()
+            debug_enabled = log.isEnabledFor(logging.DEBUG)
             
             # Sort items based on the key expression
             def get_sort_key(sort_input):
                 """Evaluate the key expression for an item"""
                 try:
-                    # Create a local context for evaluation
-                    context = {"input": sort_input.input}
-                    result = eval(sort_input.key, {"__builtins__": {}}, context)
-                    logger().debug(f"Sort: Key for item {sort_input.input} -> {result}")
+                    result = _compile_key(sort_input.key)(sort_input.input)
+                    if debug_enabled:
+                        log.debug(f"Sort: Key for item {sort_input.input} -> {result}")
                     return result
                 except Exception as e:
-                    logger().warning(f"Sort: Error evaluating key '{sort_input.key}' for item {sort_input.input}: {e}")
+                    log.warning(f"Sort: Error evaluating key '{sort_input.key}' for item {sort_input.input}: {e}")
                     # Fallback to string representation
                     return str(sort_input.input)
             
-            # Sort and yield the actual data items (not the SortInput wrappers)
-            sorted_items = sorted(sort_data, key=get_sort_key, reverse=defaults.reverse)
+            # Apply constructor defaults to None fields as items arrive
+            sort_data = (self.apply_defaults(sort_input) for sort_input in input)
+            
+            if defaults.sorted_runs:
+                runs = self._collect_runs(sort_data, get_sort_key, defaults)
+                logger().debug(f"Sort: Merging {len(runs)} pre-sorted runs")
+                merged = heapq.merge(*runs, key=operator.itemgetter(0), reverse=defaults.reverse)
+                if defaults.limit is not None:
+                    merged = itertools.islice(merged, max(defaults.limit, 0))
+                for _, sort_input in merged:
+                    yield sort_input.input
+                return
+            
+            if defaults.limit is not None:
+                # Top-N selection keeps only `limit` items in memory; equivalent
+                # to a stable sort followed by a slice
+                select = heapq.nlargest if defaults.reverse else heapq.nsmallest
+                sorted_items = select(max(defaults.limit, 0), sort_data, key=get_sort_key)
+            else:
+                # Collect all items first (Sort requires materializing the iterator)
+                sorted_items = list(sort_data)
+                logger().debug(f"Sort: Collected {len(sorted_items)} items to sort")
+                sorted_items.sort(key=get_sort_key, reverse=defaults.reverse)
+            
             logger().debug(f"Sort: Sorted {len(sorted_items)} items")
             
+            # Yield the actual data items (not the SortInput wrappers)
             for sort_input in sorted_items:
                 yield sort_input.input
                 
@@ -88,4 +140,40 @@ class Sort(PipelineElement):
             raise
         finally:
             logger().debug("Sort: Finished processing") 
-            logger().pop()
\ No newline at end of file
+            logger().pop()
+
+    @staticmethod
+    def _collect_runs(sort_data, get_sort_key, defaults) -> List[List[tuple]]:
+        """Split the input into runs of (sort key, item) pairs.
+        
+        Keys are computed once here and reused by the merge. A run ends where
+        `run_boundary_key` changes or, without one, where the sort key breaks
+        the requested order.
+        """
+        boundary_key = _compile_key(defaults.run_boundary_key) if defaults.run_boundary_key else None
+        runs: List[List[tuple]] = []
+        run: List[tuple] = []
+        previous_key = previous_boundary = None
+        
+        for sort_input in sort_data:
+            sort_key = get_sort_key(sort_input)
+            if run:
+                if boundary_key is not None:
+                    boundary = boundary_key(sort_input.input)
+                    new_run = boundary != previous_boundary
+                    previous_boundary = boundary
+                elif defaults.reverse:
+                    new_run = sort_key > previous_key
+                else:
+                    new_run = sort_key < previous_key
+                if new_run:
+                    runs.append(run)
+                    run = []
+            elif boundary_key is not None:
+                previous_boundary = boundary_key(sort_input.input)
+            run.append((sort_key, sort_input))
+            previous_key = sort_key
+        
+        if run:
+            runs.append(run)
+        return runs
@@ -1,24 +1,27 @@
 from logging import Logger
-from typing import Any, Generator, Iterator, List, Tuple, TypeVar, get_origin, get_args
-import uuid
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple, TypeVar, get_origin, get_args
+import functools
+import logging
+import queue
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .pipelineElement import PipelineElement
 from pydantic import BaseModel
 import os
-from .common import loadjson, loadyaml, instantiate, logger
+from .common import loadjson, loadyaml, instantiate_class, logger
 import networkx as nx
 
 import inspect
 from dataclasses import is_dataclass, fields
 from typing import get_type_hints
 
-from dataclasses import is_dataclass, fields
-
 InputType = TypeVar("InputType", bound=BaseModel)
 OutputType = TypeVar("OutputType", bound=BaseModel)
 
+# Timestamps below come from time.perf_counter(): monotonic and high
+# resolution, so only differences between them are meaningful
 @dataclass
 class ElementMetrics:
     element_id: str
@@ -31,7 +34,7 @@ class ElementMetrics:
     def duration(self) -> float:
         if self.start_time is None:
             return 0.0
-        end = self.end_time if self.end_time is not None else time.time()
+        end = self.end_time if self.end_time is not None else time.perf_counter()
         return end - self.start_time
 
 @dataclass
@@ -49,14 +52,96 @@ class PipelineStats:
     def duration(self) -> float:
         if self.start_time is None:
             return 0.0
-        end = self.end_time if self.end_time is not None else time.time()
+        end = self.end_time if self.end_time is not None else time.perf_counter()
         return end - self.start_time
 
+# Origins of Iterator[...] and Generator[...] annotations (collections.abc)
+_ITERATOR_ORIGIN = get_origin(Iterator[object])
+_GENERATOR_ORIGIN = get_origin(Generator[object, None, None])
+
+@functools.lru_cache(maxsize=None)
+def _parameter_types(func):
+    """Map a function's parameter names to their type hints (None if unannotated).
+    
+    Annotations don't change at runtime, so the slow signature/get_type_hints
+    resolution happens once per function.
+    """
+    # Get the signature of the function
+    signature = inspect.signature(func)
+    
+    # Get the type hints of the function
+    type_hints = get_type_hints(func)
+    
+    # Extract the parameter types
+    parameter_types = {}
+    for param in signature.parameters.values():
+        param_name = param.name
+        param_type = type_hints.get(param_name, None)
+        parameter_types[param_name] = param_type
+    
+    return parameter_types
+
+@functools.lru_cache(maxsize=None)
+def _yield_type(func):
+    """Item type a generator function declares (X in Generator[X, ...] or Iterator[X]), else None"""
+    try:
+        return_type = get_type_hints(func).get("return")
+    except Exception:
+        return None
+    if get_origin(return_type) in (_ITERATOR_ORIGIN, _GENERATOR_ORIGIN) and get_args(return_type):
+        return get_args(return_type)[0]
+    return None
+
+@dataclass(frozen=True)
+class _ConversionPlan:
+    """Per-element facts needed to convert incoming items, computed once"""
+    arg_type: Any
+    is_dataclass: bool
+    valid_fields: frozenset
+    has_input_field: bool
+    passthrough: bool  # Any/None input - items are passed through untouched
+    arg_origin: Any  # get_origin(arg_type), e.g. collections.abc.Iterator
+    arg_item_type: Any  # X when arg_type is Iterator[X], otherwise None
+    reuse_type: Any  # Items of exactly this type are used without conversion (None if none are)
+    convert: Callable[[Any, "_ConversionPlan", Any], Any]  # Conversion routine picked for arg_type
+    # Item type -> input field names its dataclass shares with arg_type (None
+    # for non-dataclasses); streams carry only a handful of distinct types, so
+    # this is filled on first sight
+    shared_fields: Dict[type, Optional[tuple]] = field(default_factory=dict, compare=False)
+
+@dataclass(frozen=True)
+class _ElementPlan:
+    """Everything process() needs about one element, resolved in Pipeline.__init__"""
+    element: PipelineElement
+    element_id: str
+    element_name: str
+    conversion: Optional[_ConversionPlan]  # None if process() has no 'input' parameter
+
+@functools.lru_cache(maxsize=None)
+def _typename(obj):
+    """Fully qualified name of a class (classes are few, so cache the formatted string)"""
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+# Marks the end of a stage's output in parallel mode
+_END_OF_STREAM = object()
+
+class _StageFailure:
+    """Carries an exception raised on a stage thread to the consuming thread"""
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
 class Pipeline(PipelineElement):
-    def __init__(self, elements: List[dict], stop_on_error: bool = True):
+    def __init__(self, elements: List[dict], stop_on_error: bool = True, parallel: bool = False, max_queue_size: int = 32):
         self.elements = []
         self.logger = logger()
         self.stop_on_error = stop_on_error
+        # Run each element on its own thread, connected by bounded queues, so
+        # stages that release the GIL (I/O, native code) overlap
+        self.parallel = parallel
+        self.max_queue_size = max_queue_size
+        self._graph = None  # Built on first to_graph() call
         try:
             logger().push()
             for e in elements:
@@ -68,127 +153,252 @@ class Pipeline(PipelineElement):
         finally:
             self.logger.pop()
         
+        self._plans = []
+        upstream = None
+        for e in self.elements:
+            self._plans.append(_ElementPlan(
+                element=e, element_id=self._get_id(e), element_name=e.__class__.__name__,
+                conversion=self._build_plan(e, upstream)))
+            upstream = e
+        self._element_headers = [
+            f"→ Element {i}/{len(self._plans)}: {plan.element_name}" for i, plan in enumerate(self._plans, 1)]
+        
+    def _build_plan(self, element, upstream=None):
+        """Resolve an element's input type once so items don't pay for reflection.
+        
+        upstream is the element feeding this one within the pipeline, if any.
+        Returns None if the element's process() has no 'input' parameter; that
+        is reported when the element runs.
+        """
+        param_types = self._get_parameter_types(element.process)
+        if "input" not in param_types:
+            return None
+        
+        arg_type = param_types["input"].__args__[0]
+        arg_is_dataclass = is_dataclass(arg_type)
+        valid_fields = frozenset(f.name for f in fields(arg_type)) if arg_is_dataclass else frozenset()
+        passthrough = arg_type == None.__class__ or arg_type == Any
+        arg_origin = get_origin(arg_type)
+        
+        # Pick the one conversion routine that can apply to this input type, so
+        # items don't re-check branches that were decided here. A dataclass
+        # never matches the simple-type shortcut, and only dataclasses can be
+        # filled by field copying.
+        if passthrough:
+            convert = self._pass_item
+        elif arg_is_dataclass:
+            convert = self._convert_item_to_dataclass
+        else:
+            convert = self._convert_item_to_other
+        
+        # Items of exactly the input type need no conversion. Dataclass inputs
+        # are normally copied, since apply_defaults() writes into them and
+        # Fork hands the same item to several paths; the exception is when the
+        # upstream element in this pipeline declares that it yields this very
+        # dataclass, so each instance is fresh and only this element sees it.
+        if arg_is_dataclass:
+            reuse_type = arg_type if upstream is not None and _yield_type(getattr(upstream.process, "__func__", upstream.process)) is arg_type else None
+        else:
+            reuse_type = arg_type if not passthrough and isinstance(arg_type, type) else None
+        
+        return _ConversionPlan(
+            arg_type=arg_type,
+            is_dataclass=arg_is_dataclass,
+            valid_fields=valid_fields,
+            has_input_field='input' in valid_fields,
+            passthrough=passthrough,
+            arg_origin=arg_origin,
+            arg_item_type=arg_type.__args__[0] if arg_origin is _ITERATOR_ORIGIN else None,
+            reuse_type=reuse_type,
+            convert=convert)
+        
     def _get_dict(self, obj):
         """Convert object to dictionary representation"""
-        if isinstance(obj, dict):
+        # Exact type checks first, then a single isinstance call so the common
+        # object-with-__dict__ route goes straight to the EAFP lookup
+        t = type(obj)
+        if t is dict:
             return obj
-        elif isinstance(obj, tuple): # Tuples are treated differently
-            d = {}
-            for i in range(len(obj)):
-                d[f"_{i}"] = obj[i]
-            return d
-        elif hasattr(obj, "__dict__"):
-            return obj.__dict__
-        else:
-            # For non-dict types, wrap in a dict with 'input' key
-            # This handles the case where previous element outputs a simple value
-            # that needs to be converted to a dataclass with an 'input' field
-            return {"input": obj}
+        if t is not tuple:
+            if not isinstance(obj, (dict, tuple)):
+                try:
+                    return obj.__dict__
+                except AttributeError:
+                    # For non-dict types, wrap in a dict with 'input' key
+                    # This handles the case where previous element outputs a simple value
+                    # that needs to be converted to a dataclass with an 'input' field
+                    return {"input": obj}
+            if isinstance(obj, dict): # dict subclasses
+                return obj
+        # Tuples (including namedtuples) are treated differently
+        return {f"_{i}": value for i, value in enumerate(obj)}
 
     def _get_typename(self, obj):
         """Get typename string for an object"""
-        return f"{obj.__module__}.{obj.__qualname__}"
+        return _typename(obj)
     
     def _get_id(self, obj):
         """Get ID string for an object"""
-        return self._get_typename(type(obj))
+        return _typename(type(obj))
     
     def _get_parameter_types(self, func):
         """Get parameter types for a function"""
-        # Get the signature of the function
-        signature = inspect.signature(func)
-        
-        # Get the type hints of the function
-        type_hints = get_type_hints(func)
-        
-        # Extract the parameter types
-        parameter_types = {}
-        for param in signature.parameters.values():
-            param_name = param.name
-            param_type = type_hints.get(param_name, None)
-            parameter_types[param_name] = param_type
-        
-        return parameter_types
+        # Bound methods are unwrapped so every instance of a class shares the cache entry
+        return _parameter_types(getattr(func, "__func__", func))
     
     def _flatten(self, iterable):
         """Flatten nested iterables"""
-        for item in iterable:
-            if isinstance(item, list) and not isinstance(item, (str, bytes)):
-                yield from self._flatten(item)
+        # An explicit stack of iterators avoids a nested generator per list level
+        stack = [iter(iterable)]
+        while stack:
+            for item in stack[-1]:
+                if type(item) is list:
+                    stack.append(iter(item))
+                    break
+                yield item
             else:
-                yield item        
+                stack.pop()
     
     def _is_simple_type(self, obj):
         """Check if object is a simple type"""
-        simple_types = (int, float, str, bool, bytes, type(None))
-        return isinstance(obj, simple_types)
+        t = type(obj)
+        return t is int or t is float or t is str or t is bool or t is bytes or obj is None
     
-    def _is_input(self, obj, input_arg_type):
-        """Check if object matches input argument type"""
+    def _is_input(self, obj, plan: _ConversionPlan):
+        """Check if object matches the plan's input argument type"""
+        input_arg_type = plan.arg_type
         if self._is_simple_type(obj) and type(obj) == input_arg_type:
             return True
 
-        input_is_iterator = get_origin(input_arg_type) == get_origin(Iterator[object])
-        if not input_is_iterator:
+        # Only Iterator[X] inputs have an item type to match against
+        if plan.arg_item_type is None:
             return False
         
         # Direct match, just pass it through
-        input_is_input_arg_type = input_is_iterator and type(obj) == input_arg_type.__args__[0]
-        return input_is_input_arg_type
+        return type(obj) == plan.arg_item_type
            
-    def _is_assignable_to_input(self, obj, input_arg_type):
-        """Check if object can be assigned to input argument type"""
-        # At this point we need to ensure that input_arg_type and obj are dataclasses
-        input_is_dataclass = hasattr(input_arg_type, "__dataclass_fields__")
-        obj_is_dataclass = is_dataclass(obj)
-        if not input_is_dataclass or not obj_is_dataclass:
-            return False
+    def _shared_fields(self, obj, plan: _ConversionPlan):
+        """Names of the plan's input fields that obj's dataclass also declares.
         
-        input_is_assignable = set(fields(input_arg_type)).issubset(set(fields(obj)))
-        return input_is_assignable
+        None if obj isn't a dataclass. Depends only on type(obj), so it is
+        cached on the plan.
+        """
+        obj_type = type(obj)
+        try:
+            return plan.shared_fields[obj_type]
+        except KeyError:
+            # Read the class's field mapping; fields() would build a fresh tuple
+            obj_fields = getattr(obj_type, "__dataclass_fields__", None)
+            shared = None if obj_fields is None else tuple(name for name in plan.valid_fields if name in obj_fields)
+            plan.shared_fields[obj_type] = shared
+            return shared
+
+    def _is_assignable_to_input(self, obj, plan: _ConversionPlan):
+        """Check if object can be assigned to the plan's (dataclass) input type"""
+        shared = self._shared_fields(obj, plan)
+        return shared is not None and len(shared) == len(plan.valid_fields)
 
-    def _tracked_generator(self, generator, metrics: ElementMetrics):
+    def _tracked_generator(self, generator, metrics: ElementMetrics, log=None):
         """Wrap a generator to track item flow and update metrics"""
+        if log is None:
+            log = logger()
         items_processed = 0
         first_item = True
         try:
-            for item in generator:
+            iterator = iter(generator)
+            for item in iterator:
                 # Log start on first item
-                if first_item:
-                    metrics.start_time = time.time()
-                    metrics.status = "running"
-                    logger().info(f"  Starting processing...")
-                    first_item = False
+                metrics.start_time = time.perf_counter()
+                metrics.status = "running"
+                log.info("  Starting processing...")
+                first_item = False
                 
+                items_processed = metrics.items_processed = 1
+                yield item
+                break
+            
+            # The remaining items skip the first-item bookkeeping
+            for item in iterator:
                 items_processed += 1
                 metrics.items_processed = items_processed
                 yield item
                 
         except Exception as e:
             metrics.status = "failed"
-            metrics.end_time = time.time()
-            logger().info(f"  Failed after {items_processed} items ({metrics.duration:.1f}s)")
+            metrics.end_time = time.perf_counter()
+            log.info("  Failed after %d items (%.1fs)", items_processed, metrics.duration)
             raise
         else:
             metrics.status = "completed"
-            metrics.end_time = time.time()
-            logger().info(f"  Completed ({items_processed} items, {metrics.duration:.1f}s)")
+            metrics.end_time = time.perf_counter()
+            log.info("  Completed (%d items, %.1fs)", items_processed, metrics.duration)
         finally:
             # Update final count
             metrics.items_processed = items_processed
             # Handle case where no items were processed
             if first_item:
-                metrics.start_time = time.time()
+                metrics.start_time = metrics.end_time = time.perf_counter()
                 metrics.status = "completed"
-                metrics.end_time = time.time()
-                logger().info(f"  Completed (0 items, {metrics.duration:.1f}s)")
+                log.info("  Completed (0 items, %.1fs)", metrics.duration)
+
+    def _threaded(self, stream, name):
+        """Drive a stage's generator on its own thread, handing items over through a bounded queue.
+        
+        Items keep their order (the queue is FIFO) and a failure in the stage is
+        re-raised in the consuming thread. Closing this generator early stops
+        the thread and closes the stage.
+        """
+        handoff = queue.Queue(maxsize=self.max_queue_size)
+        stopped = threading.Event()
+
+        def put(item):
+            # Keep checking for an early close so a full queue can't strand the thread
+            while not stopped.is_set():
+                try:
+                    handoff.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            outcome = _END_OF_STREAM
+            try:
+                for item in stream:
+                    if not put(item):
+                        # closed early; nobody is waiting for an outcome
+                        outcome = None
+                        break
+            except BaseException as ex:
+                outcome = _StageFailure(ex)
+            finally:
+                try:
+                    # Always wake the consumer, whatever ended the stage
+                    if outcome is not None:
+                        put(outcome)
+                finally:
+                    stream.close()
+
+        thread = threading.Thread(target=produce, name=f"conduit-{name}", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = handoff.get()
+                if item is _END_OF_STREAM:
+                    return
+                if type(item) is _StageFailure:
+                    raise item.error
+                yield item
+        finally:
+            stopped.set()
+            thread.join()
 
     def _log_pipeline_summary(self):
         """Log comprehensive pipeline execution summary"""
         if not hasattr(self, 'stats') or not self.stats:
             return
         
-        self.stats.end_time = time.time()
+        self.stats.end_time = time.perf_counter()
         logger().info("Pipeline completed")
         logger().info(f"Pipeline Summary: Total elements: {len(self.stats.element_metrics)}")
         logger().info(f"Pipeline Summary: Total execution time: {self.stats.duration:.1f}s")
@@ -211,138 +421,197 @@ class Pipeline(PipelineElement):
             element_name = metrics.element_id.split('.')[-1]  # Get just the class name
             logger().info(f"Pipeline Summary: Element {i}: {element_name} processed {metrics.items_processed} items in {metrics.duration:.1f}s")
 
-    def _convert_item_to_type(self, item, target_type):
-        """Convert a single item to the target type"""
-        logger().debug(f"Converting data item (type: {type(item)}) to {target_type}")
+    def _convert_item_to_type(self, item, plan: _ConversionPlan):
+        """Convert a single item to the plan's target type"""
+        log = logger()
+        return plan.convert(item, plan, log if log.isEnabledFor(logging.DEBUG) else None)
+
+    @staticmethod
+    def _pass_item(item, plan: _ConversionPlan, debug_log=None):
+        """Untyped (Any/None) inputs take items as they are"""
+        return item
+
+    # The converters below run once per item. debug_log is the logger when
+    # DEBUG is enabled and None otherwise, so messages are only formatted
+    # when they will be emitted.
+
+    def _convert_item_to_dataclass(self, item, plan: _ConversionPlan, debug_log=None):
+        """Convert an item to a dataclass input type"""
+        target_type = plan.arg_type
+        if debug_log is not None:
+            debug_log.debug("Converting data item (type: %s) to %s", type(item), target_type)
         
-        # Direct match - no conversion needed
-        if self._is_input(item, target_type):
-            logger().debug(f"Direct input match")
-            return item
+        shared = self._shared_fields(item, plan)
         
         # Assignable dataclass - copy fields
-        if self._is_assignable_to_input(item, target_type):
-            logger().debug(f"Assignable input - creating instance via field copying")
-            input_instance = instantiate(self._get_typename(target_type))
-            for field in fields(target_type):
-                setattr(input_instance, field.name, getattr(item, field.name))
-            return input_instance
+        if shared is not None and len(shared) == len(plan.valid_fields):
+            if debug_log is not None:
+                debug_log.debug("Assignable input - creating instance via field copying")
+            return target_type(**{name: getattr(item, name) for name in shared})
         
-        # General conversion using dict representation
-        logger().debug(f"Using get_dict conversion: {self._get_dict(item)}")
-        if is_dataclass(target_type):
-            logger().debug(f"Creating dataclass instance directly: {target_type}")
+        if debug_log is not None:
+            debug_log.debug("Creating dataclass instance directly: %s", target_type)
+        if shared is not None:
+            # Other dataclasses: read the shared fields directly rather than
+            # filtering __dict__ (which slots dataclasses don't have)
+            filtered_data = {name: getattr(item, name) for name in shared}
+        else:
+            # General conversion using dict representation
             input_data = self._get_dict(item)
             
-            # Only pass fields that exist in the dataclass
-            valid_fields = {field.name for field in fields(target_type)}
-            filtered_data = {k: v for k, v in input_data.items() if k in valid_fields}
-            
-            logger().debug(f"Filtered data for dataclass: {filtered_data}")
-            
-            # If no fields matched, pass the entire object as 'input' if that field exists
-            if not filtered_data and 'input' in valid_fields:
-                logger().debug(f"No field matches, passing entire object as 'input' field")
-                filtered_data = {'input': item}
-            
-            return target_type(**filtered_data)
-        else:
-            return instantiate(self._get_typename(target_type), **self._get_dict(item))
+            # Only pass fields that exist in the dataclass. Probing the (usually
+            # few) field names beats scanning every key of a wide dict, and a dict
+            # with exactly the dataclass's fields is passed through as is
+            valid_fields = plan.valid_fields
+            if input_data.keys() == valid_fields:
+                filtered_data = input_data
+            else:
+                filtered_data = {k: input_data[k] for k in valid_fields if k in input_data}
+        
+        if debug_log is not None:
+            debug_log.debug("Filtered data for dataclass: %s", filtered_data)
+        
+        # If no fields matched, pass the entire object as 'input' if that field exists
+        if not filtered_data and plan.has_input_field:
+            if debug_log is not None:
+                debug_log.debug("No field matches, passing entire object as 'input' field")
+            filtered_data = {'input': item}
+        
+        # The dataclass-generated __init__ is the cheapest way to build the
+        # instance; bypassing it with __new__ plus attribute/__dict__ filling
+        # measured ~40% slower and would skip required-field and __post_init__
+        # handling
+        return target_type(**filtered_data)
+
+    def _convert_item_to_other(self, item, plan: _ConversionPlan, debug_log=None):
+        """Convert an item to a non-dataclass input type"""
+        target_type = plan.arg_type
+        if debug_log is not None:
+            debug_log.debug("Converting data item (type: %s) to %s", type(item), target_type)
+        
+        # Direct match - no conversion needed
+        if self._is_input(item, plan):
+            if debug_log is not None:
+                debug_log.debug("Direct input match")
+            return item
+        
+        input_data = self._get_dict(item)
+        if debug_log is not None:
+            debug_log.debug("Using get_dict conversion: %s", input_data)
+        # The target class is already resolved, so skip instantiate's import-by-name
+        return instantiate_class(target_type, **input_data)
 
     def process(self, input: Iterator[InputType]) -> Generator[OutputType, None, None]:
+        """Stream input through every element.
+        
+        Each element's process() is called exactly once, with a lazy generator
+        over the previous stage's output, so nothing is materialized between
+        stages unless an element chooses to (e.g. Sort).
+        """
         # Initialize pipeline stats
         self.stats = PipelineStats()
-        self.stats.start_time = time.time()
+        self.stats.start_time = time.perf_counter()
         
-        logger().info(f"Pipeline started ({len(self.elements)} elements configured)")
+        # Resolved once per run and shared by every stage, instead of calling
+        # logger() (which rebuilds and compares its config) at each log site
+        log = logger()
+        log.info(f"Pipeline started ({len(self.elements)} elements configured)")
         
         # Create a lazy generator chain - each element processes the output of the previous one
-        def create_element_generator(element, input_stream, element_index=None):
+        def create_element_generator(element_plan, input_stream):
             """Create a lazy generator for a single pipeline element"""
-            element_id = self._get_id(element)
-            element_name = element.__class__.__name__
+            element = element_plan.element
+            plan = element_plan.conversion
+            element_id = element_plan.element_id
+            element_name = element_plan.element_name
             
             # Create metrics for this element
             metrics = ElementMetrics(element_id=element_id)
             if hasattr(self, 'stats') and self.stats:
                 self.stats.element_metrics.append(metrics)
             
-            # Only log if not already logged (negative index means already logged)
-            if element_index is not None and element_index > 0:
-                logger().info(f"→ Element {element_index}/{len(self.elements)}: {element_name}")
-            elif element_index is None:
-                logger().info(f"→ Element: {element_name}")
-            
             # Don't mark as starting here - wait for actual processing
             # metrics.start_time and status will be set when first item flows through
             
             try:
-                logger().push()
-                logger().debug(f"*** Processing element {element_id} ***")
-                param_types = self._get_parameter_types(element.process)
-                if "input" not in param_types:
+                log.push()
+                log.debug("*** Processing element %s ***", element_id)
+                if plan is None:
                     raise AttributeError(f"Element of type {element.__class__} does not have an 'input' parameter. Signature is {inspect.signature(element.process)}")
-                arg_type = param_types["input"].__args__[0]
                 
                 def convert_items_generator():
                     """Create a generator that yields converted items on-demand"""
+                    convert = plan.convert
+                    reuse_type = plan.reuse_type
+                    debug_log = log if log.isEnabledFor(logging.DEBUG) else None
+                    stop_on_error = self.stop_on_error
                     for item in self._flatten(input_stream):
+                        # Already the expected type - nothing to convert
+                        if type(item) is reuse_type:
+                            yield item
+                            continue
                         try:
-                            if arg_type == None.__class__ or arg_type == Any:
-                                # For untyped elements, pass item directly
-                                yield item
-                            else:
-                                # Convert item to expected type
-                                converted_item = self._convert_item_to_type(item, arg_type)
-                                yield converted_item
+                            # Convert item to expected type
+                            converted_item = convert(item, plan, debug_log)
                         except Exception as item_ex:
-                            element_id = self._get_id(element)
-                            logger().error(f"Error converting item in element {element_id}: {str(item_ex)}", exc_info=item_ex)
+                            log.error(f"Error converting item in element {element_id}: {str(item_ex)}", exc_info=item_ex)
                             
-                            if self.stop_on_error:
+                            if stop_on_error:
                                 raise
                             # Skip this item and continue with next
                             continue
+                        # Yield outside the try so errors thrown in by the consumer
+                        # aren't reported as conversion failures
+                        yield converted_item
                 
                 # Let the element decide how to consume the generator (lazy vs eager)
-                # Wrap the element's output with progress tracking
-                element_output = element.process(convert_items_generator())
-                yield from self._tracked_generator(element_output, metrics)
+                # Wrap the element's output with progress tracking. Untyped
+                # elements read the flattened stream directly, since converting
+                # their items is a no-op
+                if plan.passthrough:
+                    element_output = element.process(self._flatten(input_stream))
+                else:
+                    element_output = element.process(convert_items_generator())
+                yield from self._tracked_generator(element_output, metrics, log)
                 
             except Exception as ex:
                 if metrics.end_time is None:  # Only set if not already set by _tracked_generator
                     metrics.status = "failed"
-                    metrics.end_time = time.time()
-                logger().error(f"  Error in element {element_name}: {str(ex)}", exc_info=ex)
+                    metrics.end_time = time.perf_counter()
+                log.error(f"  Error in element {element_name}: {str(ex)}", exc_info=ex)
                 
                 if self.stop_on_error:
-                    logger().error(f"Pipeline stopped due to error in element {element_name}")
+                    log.error(f"Pipeline stopped due to error in element {element_name}")
                     raise
                 else:
-                    logger().warning(f"Continuing pipeline despite error in element {element_name}")
+                    log.warning(f"Continuing pipeline despite error in element {element_name}")
                     # Yield nothing for this element (effectively skipping it)
                     return
             finally:
-                logger().debug(f"*** Finished processing element {element_id} ***")
-                logger().pop()
+                log.debug("*** Finished processing element %s ***", element_id)
+                log.pop()
 
         # Log all elements upfront in correct order
-        for i, element in enumerate(self.elements, 1):
-            element_name = element.__class__.__name__
-            logger().info(f"→ Element {i}/{len(self.elements)}: {element_name}")
+        for header in self._element_headers:
+            log.info(header)
         
         # Chain all elements together lazily (this happens in reverse order due to lazy evaluation)
         current_stream = input
-        for i, element in enumerate(self.elements, 1):
-            # Pass negative index to avoid logging again in create_element_generator
-            current_stream = create_element_generator(element, current_stream, -i)
+        for element_plan in self._plans:
+            current_stream = create_element_generator(element_plan, current_stream)
+            if self.parallel:
+                current_stream = self._threaded(current_stream, element_plan.element_name)
         
-        # Final lazy output with total item counting
+        # Final lazy output with total item counting (kept in a local and
+        # stored once, before the summary reads it)
+        stats = self.stats
+        total_items = 0
         try:
             for item in current_stream:
-                self.stats.total_items_processed += 1
+                total_items += 1
                 yield item
         finally:
+            stats.total_items_processed = total_items
             # Log summary when pipeline completes (or fails)
             self._log_pipeline_summary()
 
@@ -362,28 +631,28 @@ class Pipeline(PipelineElement):
         return len(self.elements)
     
     @staticmethod
-    def from_config(pipeline_filename: str, logger: Logger = None, expand_env: bool = False, stop_on_error: bool = True) -> 'Pipeline':
+    def from_config(pipeline_filename: str, logger: Logger = None, expand_env: bool = False, stop_on_error: bool = True, parallel: bool = False, max_queue_size: int = 32) -> 'Pipeline':
         if os.path.splitext(pipeline_filename)[1] == ".json":
             pipeline_data = loadjson(pipeline_filename, expand_env)
         ext = os.path.splitext(pipeline_filename)[1]
         if ext == ".yaml" or ext == ".yml":
             pipeline_data = loadyaml(pipeline_filename, expand_env)
         
-        result = Pipeline(pipeline_data, stop_on_error=stop_on_error)
+        result = Pipeline(pipeline_data, stop_on_error=stop_on_error, parallel=parallel, max_queue_size=max_queue_size)
         result.logger = logger
         return result
 
     def to_graph(self, pipeline: 'Pipeline' = None)-> nx.DiGraph:
-        def get_typename(obj):
-            return f"{obj.__module__}.{obj.__qualname__}"
+        # Imported here since fork.py imports this module
+        from .elements.fork import Fork
         
         def populate(graph: nx.DiGraph, element: PipelineElement, parents: List[PipelineElement] = []) -> List[PipelineElement]:
-            if get_typename(type(element)) == 'conduit.pipeline.Pipeline':
+            if isinstance(element, Pipeline):
                 for element in element.elements:
                     parents = populate(graph, element, parents) # This is wrong, we aren't iterating over the elements
                 return parents
             
-            if get_typename(type(element)) == 'conduit.elements.fork.Fork':
+            if isinstance(element, Fork):
                 graph.add_node(element)
                 for parent in parents:
                     graph.add_edge(parent, element)
@@ -399,6 +668,11 @@ class Pipeline(PipelineElement):
 
         if pipeline is None:
             pipeline = self
+        
+        # Elements are fixed once a pipeline is built, so its graph is built once
+        if pipeline._graph is not None:
+            return pipeline._graph
+        
         graph = nx.DiGraph()
 
         parents = []
@@ -407,4 +681,5 @@ class Pipeline(PipelineElement):
                 graph.add_edge(p, e)
             parents = populate(graph, e, parents)
 
+        pipeline._graph = graph
         return graph
\ No newline at end of file
@@ -2,6 +2,7 @@ from abc import ABC
 from logging import Logger
 from typing import Generator, Generic, Iterator, TypeVar
 from pydantic import BaseModel
+import functools
 import inspect
 from .common import instantiate, logger
 
@@ -9,17 +10,51 @@ from .common import instantiate, logger
 InputType = TypeVar("InputType", bound=BaseModel)
 OutputType = TypeVar("OutputType", bound=BaseModel)
 
+# Every PipelineElement subclass defined so far, keyed by "<module>.<class name>"
+_element_registry = {}
+
+def registered_elements():
+    """Return the PipelineElement subclasses defined so far, keyed by '<module>.<class name>'"""
+    return dict(_element_registry)
+
+def capture_defaults(init):
+    """Wrap an element's __init__ so the arguments it is called with become the element's defaults.
+    
+    PipelineElement applies this to every subclass __init__ automatically. The
+    signature is resolved once per class rather than by inspecting the
+    caller's frame on every construction.
+    """
+    signature = inspect.signature(init)
+    self_name = next(iter(signature.parameters))
+
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        # Store all parameters except 'self' as defaults. Nested subclasses
+        # overwrite this as their __init__ chain runs, so the innermost
+        # constructor's arguments win.
+        self._defaults = {k: v for k, v in bound.arguments.items() if k != self_name}
+        return init(self, *args, **kwargs)
+
+    wrapper._captures_defaults = True
+    # inspect.signature() returns this directly instead of rebuilding it,
+    # e.g. when the schema generator reads constructor parameters
+    wrapper.__signature__ = signature
+    return wrapper
+
 class PipelineElement(ABC, Generic[InputType, OutputType]):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _element_registry[f"{cls.__module__}.{cls.__name__}"] = cls
+        init = cls.__dict__.get("__init__")
+        if init is not None and not getattr(init, "_captures_defaults", False):
+            cls.__init__ = capture_defaults(init)
+
     def __init__(self):
-        """Automatically capture constructor parameters from child class as defaults"""
-        self._defaults = {}
-        
-        # Get the calling frame (child class constructor)
-        frame = inspect.currentframe().f_back
-        if frame:
-            keys, _, _, values = inspect.getargvalues(frame)
-            # Store all parameters except 'self' as defaults
-            self._defaults = {k: v for k, v in values.items() if k != 'self'}
+        """Constructor parameters are captured as defaults by capture_defaults"""
+        if not hasattr(self, "_defaults"):
+            self._defaults = {}
     
     def apply_defaults(self, dataclass_instance):
         """Apply constructor defaults to None fields in dataclass instance"""
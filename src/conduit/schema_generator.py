@@ -7,33 +7,110 @@ by introspecting the Python classes and their type hints, docstrings, and signat
 Environment Variables:
 - CONDUIT_SEARCH_PATHS: Comma-separated list of additional search paths for pipeline elements
 - CONDUIT_SCHEMA_PATH: Full path for output schema file (overrides default location)
+- CONDUIT_PARALLEL_IMPORTS: Set to 0 to import element modules one at a time, e.g. when
+  they have import-time side effects that are not thread safe
 """
 
 import inspect
-import json
+import collections.abc
 import sys
 import os
+import types
 from pathlib import Path
-from typing import get_type_hints, get_origin, get_args, Any, Iterator, Generator
+from typing import get_type_hints, get_origin, get_args, Any, Union
 from dataclasses import is_dataclass, fields, MISSING
 import dataclasses
 import importlib
 import pkgutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-from .pipelineElement import PipelineElement
+from .common import dumpjson
+from .pipelineElement import PipelineElement, registered_elements
 from . import elements
 
+# JSON schema types for plain Python types, shared by every lookup
+_BASIC_JSON = {
+    str: {'type': 'string'},
+    int: {'type': 'integer'},
+    float: {'type': 'number'},
+    bool: {'type': 'boolean'},
+    list: {'type': 'array'},
+    dict: {'type': 'object'},
+    type(None): {'type': 'null'},
+}
+_STRING = _BASIC_JSON[str]
+
+# get_origin() results for generic types that map onto a JSON array, iterators
+# and unions (typing.Union and, on Python 3.10+, X | Y)
+_ARRAY_ORIGINS = frozenset({list, tuple, set, frozenset})
+_ITERATOR_ORIGINS = frozenset({collections.abc.Iterator, collections.abc.Generator, collections.abc.Iterable})
+_UNION_ORIGINS = frozenset({Union, getattr(types, 'UnionType', Union)})
+
+# Constructors that take no element-specific parameters
+_BASE_INITS = frozenset({PipelineElement.__init__, object.__init__})
+
+# Types inferred from an untyped constructor parameter's default value
+_DEFAULT_JSON = {t: _BASIC_JSON[t] for t in (bool, int, float, str, list)}
+
+@lru_cache(maxsize=None)
+def _signature(func):
+    """inspect.signature, resolved once per function"""
+    return inspect.signature(func)
+
+@lru_cache(maxsize=None)
+def _type_hints(func):
+    """get_type_hints, resolved once per function"""
+    return get_type_hints(func)
+
+@lru_cache(maxsize=None)
+def _fields(dataclass_type):
+    """dataclasses.fields builds a new tuple on every call, so keep one per type"""
+    return fields(dataclass_type)
+
+def _load_module(module_name):
+    """Import a module, returning the exception instead of raising it"""
+    try:
+        # Modules already loaded by an earlier discovery pass are reused as-is
+        return sys.modules.get(module_name) or importlib.import_module(module_name)
+    except Exception as e:
+        return e
+
+def _import_modules(module_names):
+    """Import modules on a small thread pool, returning each module or its exception in order
+    
+    Element modules are independent, so the filesystem lookups and native
+    extension loads behind their imports can overlap.
+    """
+    if len(module_names) < 2 or os.getenv('CONDUIT_PARALLEL_IMPORTS', '1') == '0':
+        return [_load_module(name) for name in module_names]
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(module_names))) as executor:
+        return list(executor.map(_load_module, module_names))
+
+def _element_classes(module):
+    """Yield (name, class) for each PipelineElement subclass defined in module"""
+    # vars() avoids inspect.getmembers' getattr on, and sorting of, every attribute
+    for name, obj in vars(module).items():
+        if (isinstance(obj, type) and 
+            issubclass(obj, PipelineElement) and 
+            obj is not PipelineElement and 
+            obj.__module__ == module.__name__):
+            yield name, obj
+
 def get_pipeline_elements_from_path(search_path, prefix="conduit"):
     """Discover PipelineElement classes from a specific module path"""
     elements_dict = {}
+    added_path = None
     
     try:
         # Add the search path to sys.path temporarily
         search_path = Path(search_path).resolve()
         if str(search_path) not in sys.path:
-            sys.path.insert(0, str(search_path))
+            added_path = str(search_path)
+            sys.path.insert(0, added_path)
         
-        # Try to import the module at this path
+        module_names = []
         for item in search_path.rglob("*.py"):
             if item.name.startswith("__"):
                 continue
@@ -43,22 +120,20 @@ def get_pipeline_elements_from_path(search_path, prefix="conduit"):
             module_parts = list(rel_path.parts[:-1]) + [rel_path.stem]
             module_name = ".".join(module_parts)
             
-            if not module_name:
-                continue
-                
+            if module_name:
+                module_names.append(module_name)
+        
+        # Try to import the modules at this path
+        for module_name, module in zip(module_names, _import_modules(module_names)):
             try:
-                module = importlib.import_module(module_name)
+                if isinstance(module, Exception):
+                    raise module
                 
                 # Find all classes that are subclasses of PipelineElement
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (hasattr(obj, '__bases__') and 
-                        any('PipelineElement' in str(base) for base in obj.__mro__) and
-                        'PipelineElement' not in str(obj) and
-                        obj.__module__ == module_name):
-                        
-                        # Create element ID with specified prefix
-                        element_id = f"{prefix}.{name}"
-                        elements_dict[element_id] = obj
+                for name, obj in _element_classes(module):
+                    # Create element ID with specified prefix
+                    element_id = f"{prefix}.{name}"
+                    elements_dict[element_id] = obj
                         
             except (ImportError, AttributeError, ValueError) as e:
                 # Skip modules that can't be imported or don't have valid classes
@@ -66,36 +141,57 @@ def get_pipeline_elements_from_path(search_path, prefix="conduit"):
                 
     except Exception as e:
         print(f"Warning: Could not search path {search_path}: {e}")
+    finally:
+        # Leaving it in front of sys.path would cost every later import an
+        # extra lookup there; the discovered modules stay in sys.modules
+        if added_path is not None:
+            try:
+                sys.path.remove(added_path)
+            except ValueError:
+                pass
     
     return elements_dict
 
-def get_all_pipeline_elements():
-    """Discover all PipelineElement classes from built-in and configured search paths"""
+def _walk_builtin_elements():
+    """Import every module in the elements package and collect its PipelineElement classes"""
     elements_dict = {}
-    
-    # Always include built-in conduit elements
     elements_module = elements
     
     # Walk through all modules in the elements package
-    for importer, modname, ispkg in pkgutil.iter_modules(elements_module.__path__, 
-                                                          elements_module.__name__ + "."):
+    modnames = [modname for importer, modname, ispkg in pkgutil.iter_modules(elements_module.__path__, 
+                                                                             elements_module.__name__ + ".")]
+    for modname, module in zip(modnames, _import_modules(modnames)):
         try:
-            module = importlib.import_module(modname)
+            if isinstance(module, Exception):
+                raise module
             
             # Find all classes that are subclasses of PipelineElement
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (issubclass(obj, PipelineElement) and 
-                    obj != PipelineElement and 
-                    obj.__module__ == modname):
-                    
-                    # Create the conduit.ElementName ID format
-                    element_id = f"conduit.{name}"
-                    elements_dict[element_id] = obj
+            for name, obj in _element_classes(module):
+                # Create the conduit.ElementName ID format
+                element_id = f"conduit.{name}"
+                elements_dict[element_id] = obj
                     
         except ImportError as e:
             print(f"Warning: Could not import {modname}: {e}")
             continue
     
+    return elements_dict
+
+def get_all_pipeline_elements():
+    """Discover all PipelineElement classes from built-in and configured search paths"""
+    elements_dict = {}
+    
+    # Always include built-in conduit elements. Importing conduit already
+    # defined them, and each one registered itself with PipelineElement.
+    for element_class in registered_elements().values():
+        if element_class.__module__.rpartition('.')[0] == elements.__name__:
+            # Create the conduit.ElementName ID format
+            elements_dict[f"conduit.{element_class.__name__}"] = element_class
+    
+    # Walk the elements package only if nothing has registered
+    if not elements_dict:
+        elements_dict.update(_walk_builtin_elements())
+    
     # Check for additional search paths from environment variable
     search_paths_env = os.getenv('CONDUIT_SEARCH_PATHS')
     if search_paths_env:
@@ -110,16 +206,20 @@ def get_all_pipeline_elements():
     
     return elements_dict
 
+@lru_cache(maxsize=None)
 def get_constructor_parameters(cls):
-    """Extract constructor parameters and their types"""
+    """Extract constructor parameters and their types
+    
+    Cached per class; treat the returned dict as read-only.
+    """
     try:
-        # Check if the class has its own __init__ method (not inherited from base class)
-        if '__init__' not in cls.__dict__:
-            # This class doesn't define its own __init__, so it has no specific parameters
+        # Classes still using the base constructor have no specific parameters.
+        # An __init__ inherited from another element does count.
+        if cls.__init__ in _BASE_INITS:
             return {}
             
-        signature = inspect.signature(cls.__init__)
-        type_hints = get_type_hints(cls.__init__)
+        signature = _signature(cls.__init__)
+        type_hints = _type_hints(cls.__init__)
         
         params = {}
         for param_name, param in signature.parameters.items():
@@ -136,22 +236,12 @@ def get_constructor_parameters(cls):
                 param_type = type_hints[param_name]
                 param_info['type'] = python_type_to_json_schema_type(param_type)
             else:
-                # Infer type from default value if available
+                # Infer type from default value if available. Looking up the
+                # exact type keeps bool from matching int.
                 if param.default != param.empty:
-                    if isinstance(param.default, bool):
-                        param_info['type'] = {'type': 'boolean'}
-                    elif isinstance(param.default, int):
-                        param_info['type'] = {'type': 'integer'}
-                    elif isinstance(param.default, float):
-                        param_info['type'] = {'type': 'number'}
-                    elif isinstance(param.default, str):
-                        param_info['type'] = {'type': 'string'}
-                    elif isinstance(param.default, list):
-                        param_info['type'] = {'type': 'array'}
-                    else:
-                        param_info['type'] = {'type': 'string'}
+                    param_info['type'] = _DEFAULT_JSON.get(type(param.default), _STRING)
                 else:
-                    param_info['type'] = {'type': 'string'}
+                    param_info['type'] = _STRING
             
             # Get default value
             if param.default != param.empty:
@@ -164,11 +254,11 @@ def get_constructor_parameters(cls):
         print(f"Warning: Could not get parameters for {cls.__name__}: {e}")
         return {}
 
+@lru_cache(maxsize=None)
 def get_dataclass_input_schema(cls):
-    """Generate schema for dataclass input types"""
+    """Generate schema for dataclass input types (cached per class, read-only)"""
     try:
-        signature = inspect.signature(cls.process)
-        type_hints = get_type_hints(cls.process)
+        type_hints = _type_hints(cls.process)
         
         if 'input' not in type_hints:
             return None
@@ -199,14 +289,13 @@ def generate_dataclass_schema(dataclass_type):
         'required': []
     }
     
-    for field in fields(dataclass_type):
+    for field in _fields(dataclass_type):
         field_schema = python_type_to_json_schema_type(field.type)
         
-        # Add description from docstring if available
-        if hasattr(dataclass_type, field.name):
-            attr = getattr(dataclass_type, field.name)
-            if hasattr(attr, '__doc__') and attr.__doc__:
-                field_schema['description'] = attr.__doc__.strip()
+        # Add description from field metadata if available
+        description = field.metadata.get('description')
+        if description:
+            field_schema['description'] = description
         
         schema['properties'][field.name] = field_schema
         
@@ -219,56 +308,62 @@ def generate_dataclass_schema(dataclass_type):
     return schema
 
 def python_type_to_json_schema_type(python_type):
-    """Convert Python type hints to JSON schema types"""
-    # Handle None type
-    if python_type is type(None):
-        return {'type': 'null'}
+    """Convert Python type hints to JSON schema types
     
-    # Handle basic types
-    if python_type == str:
-        return {'type': 'string'}
-    elif python_type == int:
-        return {'type': 'integer'}
-    elif python_type == float:
-        return {'type': 'number'}
-    elif python_type == bool:
-        return {'type': 'boolean'}
-    elif python_type == list:
-        return {'type': 'array'}
-    elif python_type == dict:
-        return {'type': 'object'}
+    Returns a new top-level dict, so callers may add keys such as 'default'
+    or 'description'. Nested schemas are shared with the cache.
+    """
+    return dict(_resolve_json_schema_type(python_type))
+
+def _resolve_json_schema_type(python_type):
+    """Cached conversion, computed directly for unhashable type hints"""
+    try:
+        return _cached_json_schema_type(python_type)
+    except TypeError:
+        return _json_schema_type(python_type)
+
+def _json_schema_type(python_type):
+    """Uncached conversion behind python_type_to_json_schema_type"""
+    # Handle None and basic types
+    try:
+        basic = _BASIC_JSON.get(python_type)
+    except TypeError:
+        basic = None
+    if basic is not None:
+        return basic
     
     # Handle generic types
     origin = get_origin(python_type)
     args = get_args(python_type)
     
-    if origin is list:
-        if args:
+    if origin in _ARRAY_ORIGINS:
+        # Tuple args describe positions rather than a single item type
+        if args and origin is not tuple:
             return {
                 'type': 'array',
-                'items': python_type_to_json_schema_type(args[0])
+                'items': _resolve_json_schema_type(args[0])
             }
-        return {'type': 'array'}
+        return _BASIC_JSON[list]
     elif origin is dict:
-        return {'type': 'object'}
-    elif origin is type(Iterator) or origin is type(Generator):
-        # For Iterator/Generator types, we don't need to specify the schema
-        return {'type': 'string', 'description': f'Iterator/Generator type'}
+        return _BASIC_JSON[dict]
+    elif origin in _ITERATOR_ORIGINS:
+        # For Iterator/Generator/Iterable types, we don't need to specify the schema
+        return {'type': 'string', 'description': f'{origin.__name__} type'}
     
     # Handle Union types (including Optional)
-    if origin is type(None) or str(python_type).startswith('typing.Union') or str(python_type).startswith('typing.Optional'):
+    if origin in _UNION_ORIGINS:
         if args:
             # Check if this is Optional[T] (Union[T, None])
             if len(args) == 2 and type(None) in args:
                 non_none_type = args[0] if args[1] is type(None) else args[1]
-                return python_type_to_json_schema_type(non_none_type)
+                return _resolve_json_schema_type(non_none_type)
             else:
                 # Multiple types union - use anyOf
                 return {
-                    'anyOf': [python_type_to_json_schema_type(arg) for arg in args if arg is not type(None)]
+                    'anyOf': [_resolve_json_schema_type(arg) for arg in args if arg is not type(None)]
                 }
     
-    # Handle string representations of types that might not be imported
+    # Handle string annotations and anything else not resolved above
     type_str = str(python_type)
     if 'str' in type_str:
         return {'type': 'string'}
@@ -284,21 +379,29 @@ def python_type_to_json_schema_type(python_type):
     # Default fallback
     return {'type': 'string', 'description': f'Type: {python_type}'}
 
+_cached_json_schema_type = lru_cache(maxsize=1024)(_json_schema_type)
+
+@lru_cache(maxsize=None)
 def extract_class_docstring(cls):
     """Extract and clean class docstring"""
     if cls.__doc__:
-        lines = cls.__doc__.strip().split('\n')
-        # Take the first non-empty line as description
-        for line in lines:
-            line = line.strip()
-            if line:
-                return line
+        # After strip() the first line is the first non-empty one
+        first, _, _ = cls.__doc__.strip().partition('\n')
+        first = first.strip()
+        if first:
+            return first
     return f"{cls.__name__} pipeline element"
 
 
 
+@lru_cache(maxsize=None)
 def generate_element_schema(element_id, element_class):
-    """Generate JSON schema for a single pipeline element"""
+    """Generate JSON schema for a single pipeline element
+    
+    Cached per element, so regenerating the full schema (e.g. for the
+    server's /schema endpoint) skips introspection; treat the result as
+    read-only.
+    """
     schema = {
         'type': 'object',
         'description': extract_class_docstring(element_class),
@@ -315,7 +418,7 @@ def generate_element_schema(element_id, element_class):
     # Add constructor parameters (element-level configuration)
     params = get_constructor_parameters(element_class)
     for param_name, param_info in params.items():
-        param_schema = param_info.get('type', {'type': 'string'})
+        param_schema = dict(param_info.get('type', {'type': 'string'}))
         
         if 'default' in param_info:
             param_schema['default'] = param_info['default']
@@ -328,7 +431,8 @@ def generate_element_schema(element_id, element_class):
     # Look for dataclass input (per-datum configuration)
     # Check if element has an input dataclass (e.g., CliElementInput for CliElement)
     input_class_name = f"{element_class.__name__}Input"
-    module = importlib.import_module(element_class.__module__)
+    # The class was loaded from this module, so it is already in sys.modules
+    module = sys.modules.get(element_class.__module__) or importlib.import_module(element_class.__module__)
     
     if hasattr(module, input_class_name):
         input_class = getattr(module, input_class_name)
@@ -336,7 +440,7 @@ def generate_element_schema(element_id, element_class):
             print(f"Found input dataclass: {input_class_name}")
             
             # Generate schema for the dataclass and merge properties
-            for field in fields(input_class):
+            for field in _fields(input_class):
                 # Only process fields that have None default (they're optional overrides)
                 if field.default is not None:
                     continue
@@ -362,9 +466,18 @@ def generate_element_schema(element_id, element_class):
     
     return schema
 
-def generate_full_schema():
-    """Generate the complete JSON schema for Conduit pipelines"""
-    elements_dict = get_all_pipeline_elements()
+def generate_full_schema(elements_dict=None):
+    """Generate the complete JSON schema for Conduit pipelines
+    
+    Pass elements_dict when discovery has already run to avoid importing
+    every element module a second time.
+    """
+    if elements_dict is None:
+        elements_dict = get_all_pipeline_elements()
+    
+    # Sorted once so the enum and allOf come out in the same, stable order
+    # regardless of discovery order, keeping the generated file diffable
+    element_ids = sorted(elements_dict)
     
     # Base schema structure
     schema = {
@@ -382,7 +495,7 @@ def generate_full_schema():
                     'id': {
                         'type': 'string',
                         'description': 'Fully qualified class name of the pipeline element',
-                        'enum': list(elements_dict.keys())
+                        'enum': element_ids
                     }
                 },
                 'allOf': []
@@ -391,8 +504,8 @@ def generate_full_schema():
     }
     
     # Generate conditional schemas for each element type
-    for element_id, element_class in elements_dict.items():
-        element_schema = generate_element_schema(element_id, element_class)
+    for element_id in element_ids:
+        element_schema = generate_element_schema(element_id, elements_dict[element_id])
         
         conditional_schema = {
             'if': {
@@ -411,6 +524,17 @@ def generate_full_schema():
     
     return schema
 
+@lru_cache(maxsize=1)
+def _default_schema_dir():
+    """Create and return {install_location}/conduit/schema, once per process"""
+    # This module lives in the conduit package directory, so no import is needed to find it
+    conduit_path = Path(__file__).resolve().parent
+    
+    # Whether editable install or regular install, put schema inside the conduit package
+    schema_dir = conduit_path / "schema"
+    schema_dir.mkdir(exist_ok=True)
+    return schema_dir
+
 def get_schema_output_path():
     """Get the schema output path from environment variable or default location"""
     # Check for custom schema path from environment variable
@@ -420,13 +544,7 @@ def get_schema_output_path():
         return Path(custom_path)
     
     # Default: put schema in conduit package directory: {install_location}/conduit/schema
-    import conduit
-    conduit_path = Path(conduit.__file__).parent
-    
-    # Whether editable install or regular install, put schema inside the conduit package
-    schema_dir = conduit_path / "schema"
-    schema_dir.mkdir(exist_ok=True)
-    return schema_dir / "pipeline-schema.json"
+    return _default_schema_dir() / "pipeline-schema.json"
 
 def main():
     """Main function to generate and save the schema"""
@@ -449,7 +567,7 @@ def main():
         print(f"  - {element_id}")
     
     # Generate schema
-    schema = generate_full_schema()
+    schema = generate_full_schema(elements_dict)
     
     # Get output path
     schema_file = get_schema_output_path()
@@ -457,9 +575,8 @@ def main():
     # Ensure directory exists
     schema_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Write schema to file
-    with open(schema_file, 'w', encoding='utf-8') as f:
-        json.dump(schema, f, indent=2, sort_keys=True)
+    # Serialize in one go and write once, rather than in many small chunks
+    schema_file.write_bytes(dumpjson(schema, indent=True, sort_keys=True))
     
     print(f"\nSchema generated successfully: {schema_file}")
     print(f"Schema contains {len(schema['definitions']['PipelineElement']['allOf'])} element definitions")
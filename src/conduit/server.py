@@ -1,18 +1,18 @@
+import asyncio
 import os
-import sys
 import io
-import tempfile
+import hashlib
 import traceback
-from pathlib import Path
 from typing import Dict, Any, Union, List
-import uvicorn
-from fastapi import FastAPI, HTTPException, Response
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from contextlib import redirect_stdout, redirect_stderr
 
 from .pipeline import Pipeline
-from .common import logger, set_log_level
+from .common import dumpjson, logger, parseyaml, set_log_level
 
 
 class PipelineRequest(BaseModel):
@@ -37,6 +37,29 @@ class PipelineResponse(BaseModel):
 # Global working directory for server
 _server_working_directory = None
 
+# Held by /run and /run/stream while a request's working directory and
+# environment args are applied. Pipelines run on worker threads so the event
+# loop stays responsive, which means another request could otherwise run in
+# that window and see them.
+_request_state_lock = asyncio.Lock()
+
+# Seconds a /run/stream client may leave results unread before its pipeline
+# is stopped. This bounds how long one stalled (or silently disconnected)
+# reader can hold _request_state_lock and block every other pipeline request.
+STREAM_SEND_TIMEOUT = 30.0
+
+# Encoded results buffered ahead of a /run/stream client
+_STREAM_BUFFER_SIZE = 16
+
+_END_OF_RESULTS = object()
+
+# Running /run/stream producers; the event loop only keeps weak references
+_stream_tasks = set()
+
+# Serialized schema and its ETag. The element set is fixed for the life of
+# the server process, so the schema is only generated once.
+_schema_cache = None
+
 app = FastAPI(
     title="Conduit Pipeline Server",
     description="Execute Conduit data pipelines via REST API",
@@ -56,6 +79,53 @@ async def health():
     return {"status": "healthy"}
 
 
+def _save_request_state(request: PipelineRequest):
+    """Return the working directory and the current values of the request's args"""
+    return os.getcwd(), {key: os.environ.get(key) for key in request.args}
+
+
+def _apply_request_state(request: PipelineRequest):
+    """Switch to the request's working directory and set its args"""
+    # Set working directory
+    working_dir = request.working_directory or _server_working_directory or os.getcwd()
+    os.chdir(working_dir)
+    
+    # Set environment args
+    for key, value in request.args.items():
+        os.environ[key] = value
+
+
+def _restore_request_state(original_cwd: str, original_env: Dict[str, str]):
+    """Undo _apply_request_state using what _save_request_state returned"""
+    # Restore working directory
+    os.chdir(original_cwd)
+    
+    # Restore environment so args don't leak into later requests
+    for key, value in original_env.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+def _create_pipeline(request: PipelineRequest) -> Pipeline:
+    """Build the pipeline described by a request"""
+    if isinstance(request.pipeline, list):
+        # Direct JSON pipeline array (most common)
+        return Pipeline(request.pipeline, stop_on_error=request.stop_on_error)
+    elif isinstance(request.pipeline, dict):
+        # JSON pipeline as single object - wrap in list
+        return Pipeline([request.pipeline], stop_on_error=request.stop_on_error)
+    elif isinstance(request.pipeline, str):
+        # YAML string - parse in memory, expanding environment variables as from_config does
+        pipeline_config = parseyaml(request.pipeline, expand_env=True)
+        if isinstance(pipeline_config, dict):
+            pipeline_config = [pipeline_config]
+        return Pipeline(pipeline_config, stop_on_error=request.stop_on_error)
+    else:
+        raise HTTPException(status_code=400, detail="Pipeline must be either list (JSON array), dict (JSON object), or string (YAML)")
+
+
 @app.post("/run", response_model=PipelineResponse)
 async def run_pipeline(request: PipelineRequest):
     """
@@ -64,16 +134,19 @@ async def run_pipeline(request: PipelineRequest):
     Accepts either:
     - JSON pipeline configuration (dict)
     - YAML pipeline configuration (string)
+    
+    The working directory and args are process-wide state, so they are
+    applied and restored under the same lock that /run/stream holds.
     """
+    async with _request_state_lock:
+        return await run_in_threadpool(_run_pipeline, request)
+
+
+def _run_pipeline(request: PipelineRequest) -> PipelineResponse:
+    """Body of /run; the caller holds _request_state_lock"""
+    original_cwd, original_env = _save_request_state(request)
     try:
-        # Set working directory
-        original_cwd = os.getcwd()
-        working_dir = request.working_directory or _server_working_directory or original_cwd
-        os.chdir(working_dir)
-        
-        # Set environment args
-        for key, value in request.args.items():
-            os.environ[key] = value
+        _apply_request_state(request)
         
         # Capture stdout, stderr, and logs
         stdout_capture = io.StringIO()
@@ -81,24 +154,7 @@ async def run_pipeline(request: PipelineRequest):
         log_capture = io.StringIO()
         
         # Handle pipeline configuration
-        if isinstance(request.pipeline, list):
-            # Direct JSON pipeline array (most common)
-            pipeline = Pipeline(request.pipeline, stop_on_error=request.stop_on_error)
-        elif isinstance(request.pipeline, dict):
-            # JSON pipeline as single object - wrap in list
-            pipeline = Pipeline([request.pipeline], stop_on_error=request.stop_on_error)
-        elif isinstance(request.pipeline, str):
-            # YAML string - write to temp file and load
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                f.write(request.pipeline)
-                temp_path = f.name
-            
-            try:
-                pipeline = Pipeline.from_config(temp_path, expand_env=True, stop_on_error=request.stop_on_error)
-            finally:
-                os.unlink(temp_path)
-        else:
-            raise HTTPException(status_code=400, detail="Pipeline must be either list (JSON array), dict (JSON object), or string (YAML)")
+        pipeline = _create_pipeline(request)
         
         # Execute pipeline with output capture and collect all results
         results = []
@@ -149,19 +205,110 @@ async def run_pipeline(request: PipelineRequest):
             stats={}
         )
     finally:
-        # Restore working directory
-        os.chdir(original_cwd)
+        _restore_request_state(original_cwd, original_env)
+
+
+@app.post("/run/stream")
+async def run_pipeline_stream(request: PipelineRequest):
+    """
+    Execute a pipeline configuration, streaming results as they are produced
+    
+    Takes the same request as /run. The response is newline-delimited JSON
+    with one line per result. If the pipeline fails, or the client reads
+    nothing for STREAM_SEND_TIMEOUT seconds, the last line is an object with
+    an "error" key. Output printed by elements is not captured.
+    """
+    queue = asyncio.Queue(maxsize=_STREAM_BUFFER_SIZE)
+    abandoned = asyncio.Event()
+
+    async def stream_results():
+        producer = asyncio.create_task(_stream_pipeline(request, queue, abandoned))
+        _stream_tasks.add(producer)
+        producer.add_done_callback(_stream_tasks.discard)
+        try:
+            while True:
+                line = await queue.get()
+                if line is None:
+                    break
+                yield line
+        finally:
+            # The client went away: let the producer stop at its next result
+            # instead of cancelling it while a worker thread is mid-pipeline.
+            # Starlette doesn't always close this generator promptly, so the
+            # producer's send timeout remains the upper bound.
+            if not producer.done():
+                abandoned.set()
+                _discard_queued(queue)
+    
+    return StreamingResponse(stream_results(), media_type='application/x-ndjson')
+
+
+async def _stream_pipeline(request: PipelineRequest, queue: asyncio.Queue, abandoned: asyncio.Event):
+    """Run a /run/stream pipeline, feeding encoded result lines into `queue`
+
+    Each result is computed on a worker thread. _request_state_lock is held
+    until the pipeline ends, the client disconnects, or the client falls
+    STREAM_SEND_TIMEOUT seconds behind. None marks the end of the stream.
+    """
+    tail = None
+    async with _request_state_lock:
+        original_cwd, original_env = _save_request_state(request)
+        results = None
+        try:
+            _apply_request_state(request)
+            pipeline = await run_in_threadpool(_create_pipeline, request)
+            results = pipeline.process([None])
+            while not abandoned.is_set():
+                result = await run_in_threadpool(next, results, _END_OF_RESULTS)
+                if result is _END_OF_RESULTS:
+                    break
+                line = dumpjson(jsonable_encoder(result)) + b'\n'
+                try:
+                    await asyncio.wait_for(queue.put(line), STREAM_SEND_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger().warning(f"Stream client read nothing for {STREAM_SEND_TIMEOUT}s, stopping pipeline")
+                    # The client may still be connected; make room for the error line
+                    _discard_queued(queue)
+                    tail = {"error": f"Client read nothing for {STREAM_SEND_TIMEOUT}s; pipeline stopped"}
+                    break
+        except Exception as e:
+            logger().error(f"Pipeline execution failed: {str(e)}", exc_info=e)
+            tail = {"error": str(e)}
+        finally:
+            if results is not None:
+                # Runs the pipeline's cleanup (e.g. returning pooled connections)
+                await run_in_threadpool(results.close)
+            _restore_request_state(original_cwd, original_env)
+
+    if not abandoned.is_set():
+        if tail is not None:
+            await queue.put(dumpjson(tail) + b'\n')
+        await queue.put(None)
+
+
+def _discard_queued(queue: asyncio.Queue):
+    while not queue.empty():
+        queue.get_nowait()
 
 
 @app.get("/schema")
-async def get_schema():
+async def get_schema(request: Request):
     """
     Get the current pipeline schema for available elements
     """
+    global _schema_cache
     try:
-        from .schema_generator import generate_schema
-        schema = generate_schema()
-        return schema
+        if _schema_cache is None:
+            from .schema_generator import generate_full_schema
+            body = dumpjson(generate_full_schema(), sort_keys=True)
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            _schema_cache = (body, etag)
+        
+        body, etag = _schema_cache
+        headers = {'ETag': etag, 'Cache-Control': 'public, max-age=3600'}
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type='application/json', headers=headers)
     except Exception as e:
         logger().error(f"Schema generation failed: {str(e)}", exc_info=e)
         raise HTTPException(status_code=500, detail=f"Schema generation failed: {str(e)}")
@@ -176,6 +323,9 @@ def start_server(host: str = "127.0.0.1", port: int = 8000, working_directory: s
         port: Port to bind to  
         working_directory: Default working directory for pipeline execution
     """
+    # Only needed to serve, not to import the app
+    import uvicorn
+    
     global _server_working_directory
     _server_working_directory = working_directory
     
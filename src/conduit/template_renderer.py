@@ -5,80 +5,62 @@ This module provides secure template rendering using Jinja2 to replace
 unsafe eval() usage throughout the codebase.
 """
 
-import os
-from typing import Any, Dict
-from jinja2 import Environment, BaseLoader, TemplateError, select_autoescape
+import functools
+import re
+from typing import Any, Callable, Dict, Optional
+from .utils import format_globals
+
+# jinja2 is imported when the first renderer is created, so importing conduit
+# (for example to show CLI help or generate the schema) doesn't pay for it
+Environment = BaseLoader = TemplateError = None
+
+def _import_jinja2():
+    """Bind the jinja2 names above on first use"""
+    global Environment, BaseLoader, TemplateError
+    if Environment is None:
+        from jinja2 import Environment, BaseLoader, TemplateError
+
+# A {{ path }} expression with an optional chain of filters, e.g. {{ path | get_dirname }}
+_PATH_EXPRESSION = re.compile(r"\{\{\s*path\s*((?:\|\s*\w+\s*)*)\}\}")
+
+
+def _is_literal(template_string: str) -> bool:
+    """Check whether a template has no Jinja2 markup and renders to itself"""
+    return (isinstance(template_string, str)
+            and '{{' not in template_string and '{%' not in template_string
+            and '{#' not in template_string and '\r' not in template_string)
 
 
 class SafeTemplateRenderer:
     """Safe template renderer using Jinja2 with restricted functionality"""
     
     def __init__(self):
+        _import_jinja2()
+        
         # Create a sandboxed Jinja2 environment
         self.env = Environment(
             loader=BaseLoader(),
-            autoescape=select_autoescape(),
+            # Templates produce paths, URLs, patterns and console text, never
+            # HTML, so values are inserted as-is rather than HTML-escaped
+            autoescape=False,
             # Disable some potentially dangerous features
             enable_async=False,
         )
         
         # Add custom filters for path operations
         self._add_path_filters()
+        
+        # Elements render the same few templates for every item, so parse
+        # and compile each template string only once
+        self._compile = functools.lru_cache(maxsize=512)(self.env.from_string)
+        self._compile_path = functools.lru_cache(maxsize=512)(self._build_path_template)
     
     def _add_path_filters(self):
         """Add custom filters for path manipulation"""
-        
-        def get_filename(path: str) -> str:
-            """Get only the filename part of the path"""
-            return os.path.basename(path)
-        
-        def get_extension(path: str) -> str:
-            """Get only the extension part of the path"""
-            return os.path.splitext(path)[1]
-        
-        def get_basename(path: str) -> str:
-            """Get only the basename part of the path (filename without extension)"""
-            return os.path.splitext(os.path.basename(path))[0]
-        
-        def get_dirname(path: str) -> str:
-            """Get only the directory name part of the path"""
-            return os.path.dirname(path)
-        
-        def get_stem(path: str) -> str:
-            """Get only the stem part of the path (same as basename)"""
-            return os.path.splitext(os.path.basename(path))[0]
-        
-        def get_abspath(path: str) -> str:
-            """Get the absolute path"""
-            return os.path.abspath(path)
-        
-        def get_realpath(path: str) -> str:
-            """Get the real path (resolving symlinks)"""
-            return os.path.realpath(path)
-        
-        def get_relpath(path: str) -> str:
-            """Get the relative path"""
-            return os.path.relpath(path)
-        
-        def get_normpath(path: str) -> str:
-            """Get the normalized path"""
-            return os.path.normpath(path)
-        
-        def get_filename_without_extension(path: str) -> str:
-            """Get filename without extension"""
-            return os.path.splitext(path)[0]
-        
-        # Register filters
-        self.env.filters['get_filename'] = get_filename
-        self.env.filters['get_extension'] = get_extension
-        self.env.filters['get_basename'] = get_basename
-        self.env.filters['get_dirname'] = get_dirname  
-        self.env.filters['get_stem'] = get_stem
-        self.env.filters['get_abspath'] = get_abspath
-        self.env.filters['get_realpath'] = get_realpath
-        self.env.filters['get_relpath'] = get_relpath
-        self.env.filters['get_normpath'] = get_normpath
-        self.env.filters['get_filename_without_extension'] = get_filename_without_extension
+        # The same helpers PathTransform exposes as template functions,
+        # registered directly rather than through wrapper closures
+        self._path_filters = format_globals.get_functions()
+        self.env.filters.update(self._path_filters)
     
     def render_template(self, template_string: str, context: Dict[str, Any]) -> str:
         """
@@ -94,9 +76,13 @@ class SafeTemplateRenderer:
         Raises:
             TemplateError: If template rendering fails
         """
+        if _is_literal(template_string):
+            # Nothing to render; match Jinja's removal of a single trailing newline
+            return template_string[:-1] if template_string.endswith('\n') else template_string
+        
         try:
-            template = self.env.from_string(template_string)
-            return template.render(**context)
+            template = self._compile(template_string)
+            return template.render(context)
         except TemplateError as e:
             raise TemplateError(f"Template rendering failed: {e}")
         except Exception as e:
@@ -113,7 +99,67 @@ class SafeTemplateRenderer:
         Returns:
             Rendered string
         """
+        render = self.compile_path_template(template_string)
+        if render is not None:
+            return render(path)
         return self.render_template(template_string, {'path': path})
+    
+    def compile_path_template(self, template_string: str) -> Optional[Callable[[Any], str]]:
+        """
+        Compile a simple path template into a function that renders it without Jinja2.
+        
+        Only templates made of literal text and {{ path }} expressions, each
+        with an optional chain of the path filters above, are supported.
+        
+        Args:
+            template_string: Template string that expects a 'path' variable
+            
+        Returns:
+            A function taking the path and returning the rendered string, or
+            None if the template needs the full Jinja2 renderer
+        """
+        if not isinstance(template_string, str):
+            return None
+        return self._compile_path(template_string)
+    
+    def _build_path_template(self, template_string: str) -> Optional[Callable[[Any], str]]:
+        if '\r' in template_string:
+            return None
+        
+        # Literal text and, for each expression, the tuple of filters to apply
+        parts = []
+        position = 0
+        for match in _PATH_EXPRESSION.finditer(template_string):
+            parts.append(template_string[position:match.start()])
+            filters = []
+            for name in match.group(1).split('|')[1:]:
+                name = name.strip()
+                if name not in self._path_filters:
+                    return None
+                filters.append(self._path_filters[name])
+            parts.append(tuple(filters))
+            position = match.end()
+        tail = template_string[position:]
+        # Match Jinja's removal of a single trailing newline
+        parts.append(tail[:-1] if tail.endswith('\n') else tail)
+        
+        for part in parts:
+            if isinstance(part, str) and ('{{' in part or '{%' in part or '{#' in part):
+                return None
+        
+        def render(path: Any) -> str:
+            rendered = []
+            for part in parts:
+                if isinstance(part, str):
+                    rendered.append(part)
+                    continue
+                value = path
+                for path_filter in part:
+                    value = path_filter(value)
+                rendered.append(str(value))
+            return ''.join(rendered)
+        
+        return render
 
 
 # Global renderer instance
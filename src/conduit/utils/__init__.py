@@ -1 +1,2 @@
-from .format_globals import get_functions
\ No newline at end of file
+from .format_globals import get_functions
+from .ttl_cache import TTLCache
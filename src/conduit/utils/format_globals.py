@@ -1,40 +1,45 @@
 import os
 
-def get_filename(f: str) -> str:
-    # Get only the filename part of the string
-    return os.path.basename(f)
+# The single-pass helpers below only hold when '/' is the only path separator
+_SLASH_ONLY = os.sep == '/' and os.altsep is None
+
+# Helpers that are exactly an os.path function are bound directly, saving a
+# call frame per use
+
+# Get only the filename part of the string
+get_filename = os.path.basename
 
 def get_extension(f: str) -> str:
     # Get only the extension part of the string
     return os.path.splitext(f)[1]
 
 def get_basename(f: str) -> str:
-    # Get only the basename part of the string
-    return os.path.splitext(os.path.basename(f))[0]
+    # Get only the basename part of the string. Single-pass equivalent of
+    # os.path.splitext(os.path.basename(f))[0] for plain strings
+    if type(f) is not str or not _SLASH_ONLY:
+        return os.path.splitext(os.path.basename(f))[0]
+    name = f.rpartition('/')[2]
+    stem, dot, _ = name.rpartition('.')
+    # Leading dots don't start an extension (".bashrc" has none)
+    return stem if dot and stem.strip('.') else name
 
-def get_dirname(f: str) -> str:
-    # Get only the dirname part of the string
-    return os.path.dirname(f)
+# Get only the dirname part of the string
+get_dirname = os.path.dirname
 
-def get_stem(f: str) -> str:
-    # Get only the stem part of the string
-    return os.path.splitext(os.path.basename(f))[0]
+# Get only the stem part of the string (same as basename)
+get_stem = get_basename
 
-def get_abspath(f: str) -> str:
-    # Get only the abspath part of the string
-    return os.path.abspath(f)
+# Get only the abspath part of the string
+get_abspath = os.path.abspath
 
-def get_realpath(f: str) -> str:
-    # Get only the realpath part of the string
-    return os.path.realpath(f)
+# Get only the realpath part of the string
+get_realpath = os.path.realpath
 
-def get_relpath(f: str) -> str:
-    # Get only the relpath part of the string
-    return os.path.relpath(f)
+# Get only the relpath part of the string
+get_relpath = os.path.relpath
 
-def get_normpath(f: str) -> str:
-    # Get only the normpath part of the string
-    return os.path.normpath(f)
+# Get only the normpath part of the string
+get_normpath = os.path.normpath
 
 def get_filename_without_extension(f: str) -> str:
     # Get only the filename without extension part of the string
@@ -42,4 +47,5 @@ def get_filename_without_extension(f: str) -> str:
 
 def get_functions() -> dict[str, callable]:
     # Find all functions in this module and return them as a dictionary
-    return {name: obj for name, obj in globals().items() if callable(obj) and name.startswith("get_")}
+    return {name: obj for name, obj in globals().items()
+            if callable(obj) and name.startswith("get_") and name != "get_functions"}